@@ -10,16 +10,48 @@ Usage:
 """
 
 import argparse
+import hashlib
+import html
 import json
 import os
+import pickle
 import re
 import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import yaml
+# Line-level slide constructs, found in a single pass over the slide text.
+# Every branch spans a whole line; anything between two matches is plain text.
+_SLIDE_SCAN_RE = re.compile(
+    r"""
+    ^(?:
+        (?P<fence>```[^\n]*)
+      | (?P<metric><!--[^\S\n]*metric:
+            [^\S\n]*value="(?P<metric_value>[^"\n]+)"
+            [^\S\n]*label="(?P<metric_label>[^"\n]+)"[^\n]*)
+      | (?P<cta><!--[^\S\n]*cta:
+            [^\S\n]*text="(?P<cta_text>[^"\n]+)"
+            [^\S\n]*url="(?P<cta_url>[^"\n]+)"[^\n]*)
+      | (?P<image>!\[(?P<image_alt>[^\]\n]*)\]\((?P<image_src>[^)\n]+)\)[^\n]*)
+      | (?P<h1>\#[ ][^\n]*)
+      | (?P<h2>\#\#[ ][^\n]*)
+      | (?P<directive>[^\S\n]*:::[^\n]*)
+    )$\n?
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+# Substrings that must be present for anything but headings and text to match
+_SLIDE_MARKERS = ("```", ":::", "<!--", "![")
+
+# On-disk cache of parsed presentations (opt-in via --cache), keyed by content hash
+CACHE_DIR = Path(os.environ.get("PRESGEN_CACHE_DIR", Path.home() / ".cache" / "presgen"))
+
+# Cached parses older than this are deleted whenever a new one is written (seconds)
+CACHE_MAX_AGE = 7 * 24 * 3600
 
 # Design style configurations
 STYLES = {
@@ -66,13 +98,22 @@ STYLES = {
     },
 }
 
+# Pre-decoded (r, g, b) tuples, stored as "<color>_rgb" on each style
+STYLE_COLORS = ("background", "text", "accent", "text_secondary")
 
-@dataclass
+for _style in STYLES.values():
+    _style.update({f"{key}_rgb": tuple(bytes.fromhex(_style[key].lstrip("#"))) for key in STYLE_COLORS})
+
+# Code block background shared by all styles (#2D2D2D)
+CODE_BACKGROUND_RGB = (0x2D, 0x2D, 0x2D)
+
+
+@dataclass(slots=True)
 class SlideContent:
     """Represents a single slide."""
 
     title: str = ""
-    content: list = field(default_factory=list)
+    content: list = field(default_factory=list)  # (kind, text) pairs, see classify_line()
     notes: str = ""
     slide_type: str = "content"  # title, content, section, metrics, code, image
     metrics: list = field(default_factory=list)
@@ -99,6 +140,8 @@ class Presentation:
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Extract YAML frontmatter from markdown content."""
     if content.startswith("---"):
+        import yaml  # Only decks with frontmatter need PyYAML
+
         parts = content.split("---", 2)
         if len(parts) >= 3:
             try:
@@ -109,21 +152,73 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     return {}, content
 
 
+# Markdown prefix for each content line kind
+LINE_PREFIXES = {"bullet": "- ", "quote": "> ", "text": ""}
+_LINE_KINDS = {prefix: kind for kind, prefix in LINE_PREFIXES.items() if prefix}
+
+
+def classify_line(line: str) -> tuple[str, str]:
+    """Tag a content line as a bullet, quote or plain text, stripping its marker."""
+    kind = _LINE_KINDS.get(line[:2])
+    if kind is None:
+        return "text", line
+    return kind, line[2:]
+
+
+def _split_lines(chunk: str) -> list:
+    """Split a run of whole lines, ignoring the final line terminator."""
+    if chunk.endswith("\n"):
+        chunk = chunk[:-1]
+    return chunk.split("\n")
+
+
 def parse_slide_content(slide_text: str) -> SlideContent:
     """Parse a single slide's markdown content."""
     slide = SlideContent()
-    lines = slide_text.strip().split("\n")
+    text = slide_text.strip()
 
-    current_section = "content"
     content_lines = []
     notes_lines = []
+
+    # Fast path: without any directive markers a slide is only headings and text
+    if not any(marker in text for marker in _SLIDE_MARKERS):
+        for line in text.split("\n"):
+            if line.startswith("# "):
+                slide.title = line[2:].strip()
+                slide.slide_type = "section"
+            elif line.startswith("## "):
+                slide.title = line[3:].strip()
+            else:
+                content_lines.append(line)
+        return _finish_slide(slide, content_lines, notes_lines)
+
+    current_section = "content"
     in_code_block = False
     code_block_lines = []
     code_lang = ""
 
-    for line in lines:
+    def add_lines(lines: list) -> None:
+        # Add plain lines to the section currently being collected
+        if in_code_block:
+            code_block_lines.extend(lines)
+        elif current_section == "notes":
+            notes_lines.extend(lines)
+        elif current_section == "columns" and slide.columns:
+            slide.columns[-1].extend(lines)
+        else:
+            content_lines.extend(lines)
+
+    prev_end = 0
+    for match in _SLIDE_SCAN_RE.finditer(text):
+        if match.start() > prev_end:
+            add_lines(_split_lines(text[prev_end : match.start()]))
+        prev_end = match.end()
+
+        kind = match.lastgroup
+        line = match.group(kind)
+
         # Handle code blocks
-        if line.startswith("```"):
+        if kind == "fence":
             if in_code_block:
                 slide.code_blocks.append({"lang": code_lang, "code": "\n".join(code_block_lines)})
                 code_block_lines = []
@@ -137,61 +232,51 @@ def parse_slide_content(slide_text: str) -> SlideContent:
             code_block_lines.append(line)
             continue
 
-        # Handle notes
-        if line.strip() == "::: notes":
-            current_section = "notes"
-            continue
-        elif line.strip() == ":::":
-            current_section = "content"
-            continue
-
-        # Handle columns
-        if line.strip() == "::: columns":
-            current_section = "columns"
-            slide.columns = []
-            continue
-        elif line.strip().startswith(":::: column"):
-            slide.columns.append([])
-            continue
-        elif line.strip() == "::::":
-            continue
+        # Handle notes and columns
+        if kind == "directive":
+            directive = line.strip()
+            if directive == "::: notes":
+                current_section = "notes"
+            elif directive == ":::":
+                current_section = "content"
+            elif directive == "::: columns":
+                current_section = "columns"
+                slide.columns = []
+            elif directive.startswith(":::: column"):
+                slide.columns.append([])
+            elif directive != "::::":
+                add_lines([line])
 
         # Handle metrics
-        metric_match = re.match(r"<!--\s*metric:\s*value=\"([^\"]+)\"\s*label=\"([^\"]+)\"", line)
-        if metric_match:
-            slide.metrics.append({"value": metric_match.group(1), "label": metric_match.group(2)})
-            continue
+        elif kind == "metric":
+            slide.metrics.append({"value": match.group("metric_value"), "label": match.group("metric_label")})
 
         # Handle CTAs
-        cta_match = re.match(r"<!--\s*cta:\s*text=\"([^\"]+)\"\s*url=\"([^\"]+)\"", line)
-        if cta_match:
-            slide.cta.append({"text": cta_match.group(1), "url": cta_match.group(2)})
-            continue
+        elif kind == "cta":
+            slide.cta.append({"text": match.group("cta_text"), "url": match.group("cta_url")})
 
         # Handle images
-        img_match = re.match(r"!\[([^\]]*)\]\(([^)]+)\)", line)
-        if img_match:
-            slide.images.append({"alt": img_match.group(1), "src": img_match.group(2)})
-            continue
+        elif kind == "image":
+            slide.images.append({"alt": match.group("image_alt"), "src": match.group("image_src")})
 
         # Handle headings
-        if line.startswith("# "):
+        elif kind == "h1":
             slide.title = line[2:].strip()
             slide.slide_type = "section"
-            continue
-        elif line.startswith("## "):
+        elif kind == "h2":
             slide.title = line[3:].strip()
-            continue
 
-        # Add to appropriate section
-        if current_section == "notes":
-            notes_lines.append(line)
-        elif current_section == "columns" and slide.columns:
-            slide.columns[-1].append(line)
-        else:
-            content_lines.append(line)
+    if prev_end < len(text):
+        add_lines(_split_lines(text[prev_end:]))
+
+    return _finish_slide(slide, content_lines, notes_lines)
 
-    slide.content = [l for l in content_lines if l.strip()]
+
+def _finish_slide(slide: SlideContent, content_lines: list, notes_lines: list) -> SlideContent:
+    """Store collected lines on the slide and settle its type."""
+    # Drop blank lines once here so renderers never re-check them
+    slide.content = [classify_line(l) for l in content_lines if l.strip()]
+    slide.columns = [[l for l in col if l.strip()] for col in slide.columns]
     slide.notes = "\n".join(notes_lines).strip()
 
     # Determine slide type
@@ -221,10 +306,12 @@ def parse_markdown(content: str) -> Presentation:
     )
 
     # Split by slide separator
-    slide_texts = re.split(r"\n---\n", body)
+    slide_texts = body.split("\n---\n")
 
     for i, slide_text in enumerate(slide_texts):
-        if not slide_text.strip():
+        # Strip once; parse_slide_content's own strip() is then a no-op
+        slide_text = slide_text.strip()
+        if not slide_text:
             continue
 
         slide = parse_slide_content(slide_text)
@@ -233,24 +320,81 @@ def parse_markdown(content: str) -> Presentation:
         if i == 0 and not slide.title:
             slide.title = pres.title
             slide.slide_type = "title"
-            slide.content = [pres.subtitle] if pres.subtitle else []
+            slide.content = [classify_line(pres.subtitle)] if pres.subtitle else []
 
         pres.slides.append(slide)
 
     return pres
 
 
+def _cache_key(content: str) -> str:
+    """Hash the source together with this parser and today's date (the default deck date)."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(datetime.now().strftime("%Y-%m-%d").encode())
+    digest.update(content.encode())
+    return digest.hexdigest()
+
+
+def _prune_cache(now: float) -> None:
+    """Delete cached parses not written within CACHE_MAX_AGE."""
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".pkl"):
+                continue
+            try:
+                if now - entry.stat().st_mtime > CACHE_MAX_AGE:
+                    os.unlink(entry.path)
+            except OSError:
+                pass  # Removed concurrently
+
+
+def load_presentation(content: str, use_cache: bool = False) -> Presentation:
+    """Parse markdown content, optionally reusing a cached parse of identical content."""
+    if not use_cache:
+        return parse_markdown(content)
+
+    cache_path = CACHE_DIR / f"{_cache_key(content)}.pkl"
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except Exception:
+        pass  # Missing, unreadable or stale entry; re-parse
+
+    pres = parse_markdown(content)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _prune_cache(time.time())
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(pres))
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # Cache is best-effort
+
+    return pres
+
+
+def _read_utf8(path: str) -> str:
+    """Read a file as bytes and decode it as UTF-8 in one step."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
 def load_research_content(research_dir: str) -> str:
     """Load research content from directory."""
-    research_path = Path(research_dir)
-    if not research_path.exists():
+    if not os.path.isdir(research_dir):
         return ""
 
-    content = []
-    for md_file in research_path.glob("*.md"):
-        content.append(md_file.read_text())
+    with os.scandir(research_dir) as entries:
+        paths = [entry.path for entry in entries if entry.name.endswith(".md") and entry.is_file()]
 
-    return "\n\n".join(content)
+    if len(paths) <= 1:
+        return "\n\n".join(map(_read_utf8, paths))
+
+    # Overlap per-file open/read latency (slow or network filesystems); map keeps order
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return "\n\n".join(executor.map(_read_utf8, paths))
 
 
 def generate_pdf(presentation: Presentation, output_path: str, style: dict) -> None:
@@ -276,15 +420,14 @@ def generate_pdf(presentation: Presentation, output_path: str, style: dict) -> N
         bottomMargin=0.5 * inch,
     )
 
-    # Convert hex colors
-    def hex_to_color(hex_color: str) -> colors.Color:
-        hex_color = hex_color.lstrip("#")
-        r, g, b = tuple(int(hex_color[i : i + 2], 16) / 255 for i in (0, 2, 4))
-        return colors.Color(r, g, b)
+    # Convert RGB tuples
+    def rgb_to_color(rgb) -> colors.Color:
+        r, g, b = rgb
+        return colors.Color(r / 255, g / 255, b / 255)
 
-    bg_color = hex_to_color(style["background"])
-    text_color = hex_to_color(style["text"])
-    accent_color = hex_to_color(style["accent"])
+    bg_color = rgb_to_color(style["background_rgb"])
+    text_color = rgb_to_color(style["text_rgb"])
+    accent_color = rgb_to_color(style["accent_rgb"])
 
     # Create styles
     styles = getSampleStyleSheet()
@@ -327,11 +470,39 @@ def generate_pdf(presentation: Presentation, output_path: str, style: dict) -> N
         "MetricLabel",
         parent=styles["Normal"],
         fontSize=16,
-        textColor=hex_to_color(style["text_secondary"]),
+        textColor=rgb_to_color(style["text_secondary_rgb"]),
         alignment=1,
         spaceAfter=20,
     )
 
+    quote_style = ParagraphStyle(
+        "Quote",
+        parent=body_style,
+        fontSize=20,
+        textColor=accent_color,
+        leftIndent=30,
+        fontName="Times-Italic",
+    )
+
+    code_style = ParagraphStyle(
+        "Code",
+        parent=styles["Code"],
+        fontSize=12,
+        textColor=text_color,
+        backColor=rgb_to_color(CODE_BACKGROUND_RGB),
+        leftIndent=20,
+        rightIndent=20,
+        spaceBefore=10,
+        spaceAfter=10,
+    )
+
+    # Marker and paragraph style per content line kind
+    content_formats = {
+        "bullet": ("• ", body_style),
+        "quote": ("", quote_style),
+        "text": ("", body_style),
+    }
+
     story = []
 
     for i, slide in enumerate(presentation.slides):
@@ -357,35 +528,12 @@ def generate_pdf(presentation: Presentation, output_path: str, style: dict) -> N
             story.append(Paragraph(metric["label"], metric_label_style))
 
         # Content
-        for line in slide.content:
-            if line.startswith("- "):
-                story.append(Paragraph(f"• {line[2:]}", body_style))
-            elif line.startswith("> "):
-                quote_style = ParagraphStyle(
-                    "Quote",
-                    parent=body_style,
-                    fontSize=20,
-                    textColor=accent_color,
-                    leftIndent=30,
-                    fontName="Times-Italic",
-                )
-                story.append(Paragraph(line[2:], quote_style))
-            elif line.strip():
-                story.append(Paragraph(line, body_style))
+        for kind, text in slide.content:
+            marker, line_style = content_formats[kind]
+            story.append(Paragraph(marker + text, line_style))
 
         # Code blocks
         for code_block in slide.code_blocks:
-            code_style = ParagraphStyle(
-                "Code",
-                parent=styles["Code"],
-                fontSize=12,
-                textColor=text_color,
-                backColor=hex_to_color("#2D2D2D"),
-                leftIndent=20,
-                rightIndent=20,
-                spaceBefore=10,
-                spaceAfter=10,
-            )
             code_text = code_block["code"].replace("\n", "<br/>")
             story.append(Paragraph(f"<pre>{code_text}</pre>", code_style))
 
@@ -393,28 +541,74 @@ def generate_pdf(presentation: Presentation, output_path: str, style: dict) -> N
     print(f"Generated PDF: {output_path}")
 
 
+# Pre-built <p:sp> for metric text boxes; equivalent to add_textbox() plus font
+# settings, but materialized with one XML parse instead of many attribute writes
+_METRIC_XML_TMPL = (
+    '<p:sp xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+    '<p:nvSpPr><p:cNvPr id="{shape_id}" name="TextBox {name_id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    '<a:p><a:pPr><a:defRPr sz="{size}"{bold}>'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:defRPr></a:pPr>'
+    "<a:r><a:t>{text}</a:t></a:r></a:p></p:txBody></p:sp>"
+)
+
+# Control characters (tab aside) are not valid XML text; python-pptx escapes or
+# splits on them, so such text takes the add_textbox() path instead
+_PPTX_CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0a-\x1f]")
+
+
 def generate_pptx(presentation: Presentation, output_path: str, style: dict) -> None:
     """Generate PowerPoint presentation using python-pptx."""
     try:
         from pptx import Presentation as PPTXPresentation
         from pptx.dml.color import RGBColor
+        from pptx.oxml import parse_xml
         from pptx.util import Inches, Pt
     except ImportError:
         print("python-pptx not installed. Skipping PPTX generation.")
         print("Install with: pip install python-pptx")
         return
 
-    def hex_to_rgb(hex_color: str) -> RGBColor:
-        hex_color = hex_color.lstrip("#")
-        return RGBColor(*[int(hex_color[i : i + 2], 16) for i in (0, 2, 4)])
+    def add_metric_box(
+        pptx_slide, x, y, cx, cy, text: str, size: int, color: RGBColor, bold: bool = False
+    ) -> None:
+        if _PPTX_CTRL_CHARS_RE.search(text):
+            para = pptx_slide.shapes.add_textbox(x, y, cx, cy).text_frame.paragraphs[0]
+            para.text = text
+            para.font.size = Pt(size)
+            para.font.color.rgb = color
+            if bold:
+                para.font.bold = True
+            return
+
+        shape_id = pptx_slide.shapes._next_shape_id
+        sp = parse_xml(
+            _METRIC_XML_TMPL.format(
+                shape_id=shape_id,
+                name_id=shape_id - 1,
+                x=x,
+                y=y,
+                cx=cx,
+                cy=cy,
+                size=size * 100,
+                bold=' b="1"' if bold else "",
+                color=color,
+                text=html.escape(text, quote=False),
+            )
+        )
+        pptx_slide.shapes._spTree.append(sp)
 
     prs = PPTXPresentation()
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
 
-    bg_color = hex_to_rgb(style["background"])
-    text_color = hex_to_rgb(style["text"])
-    accent_color = hex_to_rgb(style["accent"])
+    bg_color = RGBColor(*style["background_rgb"])
+    text_color = RGBColor(*style["text_rgb"])
+    accent_color = RGBColor(*style["accent_rgb"])
+    secondary_color = RGBColor(*style["text_secondary_rgb"])
 
     blank_layout = prs.slide_layouts[6]  # Blank layout
 
@@ -447,7 +641,7 @@ def generate_pptx(presentation: Presentation, output_path: str, style: dict) ->
             sub_para = sub_frame.paragraphs[0]
             sub_para.text = presentation.subtitle
             sub_para.font.size = Pt(24)
-            sub_para.font.color.rgb = hex_to_rgb(style["text_secondary"])
+            sub_para.font.color.rgb = secondary_color
             y_pos += Inches(1.5)
 
             if presentation.author:
@@ -456,7 +650,7 @@ def generate_pptx(presentation: Presentation, output_path: str, style: dict) ->
                 auth_para = auth_frame.paragraphs[0]
                 auth_para.text = f"{presentation.author} | {presentation.date}"
                 auth_para.font.size = Pt(16)
-                auth_para.font.color.rgb = hex_to_rgb(style["text_secondary"])
+                auth_para.font.color.rgb = secondary_color
 
         # Metrics
         if slide_data.metrics:
@@ -465,21 +659,29 @@ def generate_pptx(presentation: Presentation, output_path: str, style: dict) ->
                 x_pos = Inches(0.75) + (i * metric_width)
 
                 # Value
-                val_box = pptx_slide.shapes.add_textbox(x_pos, y_pos, metric_width, Inches(1))
-                val_frame = val_box.text_frame
-                val_para = val_frame.paragraphs[0]
-                val_para.text = metric["value"]
-                val_para.font.size = Pt(56)
-                val_para.font.color.rgb = accent_color
-                val_para.font.bold = True
+                add_metric_box(
+                    pptx_slide,
+                    x_pos,
+                    y_pos,
+                    metric_width,
+                    Inches(1),
+                    metric["value"],
+                    56,
+                    accent_color,
+                    bold=True,
+                )
 
                 # Label
-                lab_box = pptx_slide.shapes.add_textbox(x_pos, y_pos + Inches(1.2), metric_width, Inches(0.5))
-                lab_frame = lab_box.text_frame
-                lab_para = lab_frame.paragraphs[0]
-                lab_para.text = metric["label"]
-                lab_para.font.size = Pt(18)
-                lab_para.font.color.rgb = hex_to_rgb(style["text_secondary"])
+                add_metric_box(
+                    pptx_slide,
+                    x_pos,
+                    y_pos + Inches(1.2),
+                    metric_width,
+                    Inches(0.5),
+                    metric["label"],
+                    18,
+                    secondary_color,
+                )
 
             y_pos += Inches(2)
 
@@ -489,20 +691,20 @@ def generate_pptx(presentation: Presentation, output_path: str, style: dict) ->
             content_frame = content_box.text_frame
             content_frame.word_wrap = True
 
-            for j, line in enumerate(slide_data.content):
+            for j, (kind, text) in enumerate(slide_data.content):
                 if j == 0:
                     para = content_frame.paragraphs[0]
                 else:
                     para = content_frame.add_paragraph()
 
-                if line.startswith("- "):
-                    para.text = f"• {line[2:]}"
+                if kind == "bullet":
+                    para.text = f"• {text}"
                     para.level = 0
-                elif line.startswith("> "):
-                    para.text = line[2:]
+                elif kind == "quote":
+                    para.text = text
                     para.font.italic = True
                 else:
-                    para.text = line
+                    para.text = text
 
                 para.font.size = Pt(20)
                 para.font.color.rgb = text_color
@@ -512,20 +714,7 @@ def generate_pptx(presentation: Presentation, output_path: str, style: dict) ->
     print(f"Generated PPTX: {output_path}")
 
 
-def generate_html(presentation: Presentation, output_dir: str, style: dict) -> None:
-    """Generate HTML presentation using Reveal.js."""
-    try:
-        from jinja2 import Template
-    except ImportError:
-        print("Jinja2 not installed. Skipping HTML generation.")
-        print("Install with: pip install jinja2")
-        return
-
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    html_template = Template(
-        """<!DOCTYPE html>
+_HTML_TEMPLATE_SRC = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -633,13 +822,13 @@ def generate_html(presentation: Presentation, output_dir: str, style: dict) -> N
 
                 {% if slide.content %}
                 <ul>
-                {% for line in slide.content %}
-                    {% if line.startswith('- ') %}
-                    <li>{{ line[2:] }}</li>
-                    {% elif line.startswith('> ') %}
-                    <blockquote>{{ line[2:] }}</blockquote>
-                    {% elif line.strip() %}
-                    <p>{{ line }}</p>
+                {% for kind, text in slide.content %}
+                    {% if kind == 'bullet' %}
+                    <li>{{ text }}</li>
+                    {% elif kind == 'quote' %}
+                    <blockquote>{{ text }}</blockquote>
+                    {% else %}
+                    <p>{{ text }}</p>
                     {% endif %}
                 {% endfor %}
                 </ul>
@@ -660,7 +849,7 @@ def generate_html(presentation: Presentation, output_dir: str, style: dict) -> N
                         <h3>{{ line[4:] }}</h3>
                         {% elif line.startswith('- ') %}
                         <p>• {{ line[2:] }}</p>
-                        {% elif line.strip() %}
+                        {% else %}
                         <p>{{ line }}</p>
                         {% endif %}
                     {% endfor %}
@@ -698,35 +887,69 @@ def generate_html(presentation: Presentation, output_dir: str, style: dict) -> N
 </body>
 </html>
 """
-    )
 
-    slides_data = []
-    for slide in presentation.slides:
-        slides_data.append(
-            {
-                "title": slide.title,
-                "content": slide.content,
-                "notes": slide.notes,
-                "slide_type": slide.slide_type,
-                "metrics": slide.metrics,
-                "columns": slide.columns,
-                "code_blocks": slide.code_blocks,
-                "images": slide.images,
-                "cta": slide.cta,
-            }
-        )
+# {{ style.<key> }} references, replaced with literal values before compiling
+_STYLE_REF_RE = re.compile(r"\{\{ style\.(\w+) \}\}")
 
-    html_content = html_template.render(
-        title=presentation.title,
-        subtitle=presentation.subtitle,
-        author=presentation.author,
-        date=presentation.date,
-        style=style,
-        slides=slides_data,
-    )
+# Jinja environment and per-style compiled templates, built on first use by _get_html_template()
+_HTML_ENV = None
+_HTML_SOURCES = {}
+_HTML_TEMPLATES = {}
+
+
+def _get_html_template(style: dict):
+    """Compile the Reveal.js template specialized for a style, reusing Jinja bytecode across runs."""
+    global _HTML_ENV
+    name = f"deck-{style['name']}"
+    template = _HTML_TEMPLATES.get(name)
+    if template is None:
+        if _HTML_ENV is None:
+            from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+            bytecode_cache = None
+            try:
+                jinja_cache_dir = CACHE_DIR / "jinja"
+                jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_dir))
+            except OSError:
+                pass  # Compile in memory only
+
+            _HTML_ENV = Environment(
+                loader=DictLoader(_HTML_SOURCES),
+                auto_reload=False,
+                bytecode_cache=bytecode_cache,
+            )
+
+        # Style values are fixed for a whole render, so bake them into the source
+        _HTML_SOURCES[name] = _STYLE_REF_RE.sub(lambda m: str(style[m.group(1)]), _HTML_TEMPLATE_SRC)
+        template = _HTML_TEMPLATES[name] = _HTML_ENV.get_template(name)
+    return template
+
+
+def generate_html(presentation: Presentation, output_dir: str, style: dict) -> None:
+    """Generate HTML presentation using Reveal.js."""
+    try:
+        import jinja2  # noqa: F401
+    except ImportError:
+        print("Jinja2 not installed. Skipping HTML generation.")
+        print("Install with: pip install jinja2")
+        return
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    html_template = _get_html_template(style)
 
+    # Stream rendered chunks to disk rather than building the whole page in memory
     index_path = output_path / "index.html"
-    index_path.write_text(html_content)
+    with index_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        html_template.stream(
+            title=presentation.title,
+            subtitle=presentation.subtitle,
+            author=presentation.author,
+            date=presentation.date,
+            slides=presentation.slides,
+        ).dump(f)
     print(f"Generated HTML: {index_path}")
 
 
@@ -749,50 +972,59 @@ def generate_markdown(presentation: Presentation, output_path: str) -> None:
     lines.append("---")
     lines.append("")
 
+    # One joined chunk per slide keeps the final join short
     for i, slide in enumerate(presentation.slides):
-        if i > 0:
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+        parts = ["", "---", ""] if i > 0 else []
 
         if slide.title:
             prefix = "#" if slide.slide_type in ["title", "section"] else "##"
-            lines.append(f"{prefix} {slide.title}")
-            lines.append("")
-
-        for metric in slide.metrics:
-            lines.append(f'<!-- metric: value="{metric["value"]}" label="{metric["label"]}" -->')
+            parts += (f"{prefix} {slide.title}", "")
 
-        for line in slide.content:
-            lines.append(line)
+        parts.extend(
+            f'<!-- metric: value="{metric["value"]}" label="{metric["label"]}" -->' for metric in slide.metrics
+        )
+        parts.extend(LINE_PREFIXES[kind] + text for kind, text in slide.content)
 
         for code in slide.code_blocks:
-            lines.append(f"```{code['lang']}")
-            lines.append(code["code"])
-            lines.append("```")
+            parts += (f"```{code['lang']}", code["code"], "```")
 
         if slide.columns:
-            lines.append("::: columns")
+            parts.append("::: columns")
             for col in slide.columns:
-                lines.append(":::: column")
-                for line in col:
-                    lines.append(line)
-                lines.append("::::")
-            lines.append(":::")
+                parts.append(":::: column")
+                parts.extend(col)
+                parts.append("::::")
+            parts.append(":::")
 
-        for cta in slide.cta:
-            lines.append(f'<!-- cta: text="{cta["text"]}" url="{cta["url"]}" -->')
+        parts.extend(f'<!-- cta: text="{cta["text"]}" url="{cta["url"]}" -->' for cta in slide.cta)
 
         if slide.notes:
-            lines.append("")
-            lines.append("::: notes")
-            lines.append(slide.notes)
-            lines.append(":::")
+            parts += ("", "::: notes", slide.notes, ":::")
+
+        if parts:
+            lines.append("\n".join(parts))
 
     Path(output_path).write_text("\n".join(lines))
     print(f"Generated Markdown: {output_path}")
 
 
+def generate_format(fmt: str, presentation: Presentation, output_dir: Path, base_name: str, style: dict) -> None:
+    """Generate one output format (module-level so it can run in a worker process)."""
+    if fmt == "pdf":
+        generate_pdf(presentation, str(output_dir / f"{base_name}.pdf"), style)
+    elif fmt == "pptx":
+        generate_pptx(presentation, str(output_dir / f"{base_name}.pptx"), style)
+    elif fmt == "html":
+        generate_html(presentation, str(output_dir / base_name), style)
+    elif fmt == "md":
+        generate_markdown(presentation, str(output_dir / f"{base_name}.md"))
+
+
+def _generate_format_from_snapshot(fmt: str, snapshot: bytes, output_dir: Path, base_name: str, style: dict) -> None:
+    """Worker entry point: restore the pickled presentation and generate one format."""
+    generate_format(fmt, pickle.loads(snapshot), output_dir, base_name, style)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate presentations from markdown")
     parser.add_argument("--input", "-i", required=True, help="Input markdown file")
@@ -816,6 +1048,16 @@ def main():
         default="",
         help="Directory containing research content",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse parsed input cached in {CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Generate formats concurrently in separate processes",
+    )
 
     args = parser.parse_args()
 
@@ -833,7 +1075,7 @@ def main():
         research_content = load_research_content(args.research_dir)
 
     # Parse presentation
-    presentation = parse_markdown(content)
+    presentation = load_presentation(content, use_cache=args.cache)
     presentation.research_content = research_content
 
     # Override style if specified
@@ -861,16 +1103,22 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate outputs
-    for fmt in formats:
-        fmt = fmt.strip()
-        if fmt == "pdf":
-            generate_pdf(presentation, str(output_dir / f"{base_name}.pdf"), style)
-        elif fmt == "pptx":
-            generate_pptx(presentation, str(output_dir / f"{base_name}.pptx"), style)
-        elif fmt == "html":
-            generate_html(presentation, str(output_dir / base_name), style)
-        elif fmt == "md":
-            generate_markdown(presentation, str(output_dir / f"{base_name}.md"))
+    formats = [fmt.strip() for fmt in formats]
+    if args.parallel and len(formats) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Serialize the deck once; each worker only receives the flat bytes
+        snapshot = pickle.dumps(presentation, protocol=5)
+        with ProcessPoolExecutor(max_workers=min(len(formats), os.cpu_count() or 1)) as executor:
+            futures = [
+                executor.submit(_generate_format_from_snapshot, fmt, snapshot, output_dir, base_name, style)
+                for fmt in formats
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for fmt in formats:
+            generate_format(fmt, presentation, output_dir, base_name, style)
 
     print(f"\nGeneration complete! Output in: {output_dir}")
 
@@ -17,18 +17,67 @@ Weighting factors:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
 import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from itertools import chain
+from pathlib import Path
 from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 import requests
-from dateutil.parser import parse as parse_date
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Decodes bytes directly; orjson.JSONDecodeError subclasses ValueError
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def parse_gh_timestamp(value: str) -> datetime:
+    """Parse a GitHub API timestamp such as ``2024-01-02T03:04:05Z``."""
+    # GitHub always returns this fixed ISO 8601 shape; fromisoformat only
+    # accepts the trailing "Z" from Python 3.11 on.
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Score normalization caps, stored as reciprocals so scoring multiplies
+_COMMIT_INV = 1 / 50  # Cap at 50 commits
+_STAR_INV = 1 / 1000  # Cap at 1000 stars
+_FORK_INV = 1 / 100  # Cap at 100 forks
+_ACTIVITY_INV = 1 / 20  # Cap at 20 issues + PRs
+_PUSH_INV = 1 / 10  # Cap at 10 pushes
+_RECENCY_INV = 1 / 90  # Recency bonus decays over 90 days
+
+# Score weights, shared by RepoScore.calculate_score and score_repos
+_COMMIT_WEIGHT = 0.40
+_STAR_WEIGHT = 0.20
+_FORK_WEIGHT = 0.15
+_ACTIVITY_WEIGHT = 0.15
+_PUSH_WEIGHT = 0.10
+_RECENCY_WEIGHT = 0.2
+
+
+@dataclass(slots=True)
 class RepoScore:
     """Repository with calculated significance score."""
 
@@ -58,29 +107,29 @@ class RepoScore:
     def calculate_score(self, now: datetime) -> float:
         """Calculate weighted significance score."""
         # Normalize metrics (0-1 scale with caps)
-        commit_score = min(self.recent_commits / 50, 1.0)  # Cap at 50 commits
-        star_score = min(self.stars / 1000, 1.0)  # Cap at 1000 stars
-        fork_score = min(self.forks / 100, 1.0)  # Cap at 100 forks
-        activity_score = min((self.recent_issues + self.recent_prs) / 20, 1.0)
-        push_score = min(self.recent_pushes / 10, 1.0)
+        commit_score = min(self.recent_commits * _COMMIT_INV, 1.0)
+        star_score = min(self.stars * _STAR_INV, 1.0)
+        fork_score = min(self.forks * _FORK_INV, 1.0)
+        activity_score = min((self.recent_issues + self.recent_prs) * _ACTIVITY_INV, 1.0)
+        push_score = min(self.recent_pushes * _PUSH_INV, 1.0)
 
         # Recency bonus (repos updated in last 30 days get a boost)
         days_since_update = (now - self.updated_at).days
-        recency_bonus = max(0, 1 - (days_since_update / 90)) * 0.2
+        recency_bonus = max(0, 1 - (days_since_update * _RECENCY_INV)) * _RECENCY_WEIGHT
 
         # Apply weights
         self.score = (
-            commit_score * 0.40
-            + star_score * 0.20
-            + fork_score * 0.15
-            + activity_score * 0.15
-            + push_score * 0.10
+            commit_score * _COMMIT_WEIGHT
+            + star_score * _STAR_WEIGHT
+            + fork_score * _FORK_WEIGHT
+            + activity_score * _ACTIVITY_WEIGHT
+            + push_score * _PUSH_WEIGHT
             + recency_bonus
         )
 
         return self.score
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, now: datetime) -> dict[str, Any]:
         """Convert to dictionary for JSON output."""
         return {
             "name": self.name,
@@ -93,17 +142,155 @@ class RepoScore:
             "topics": self.topics,
             "score": round(self.score, 4),
             "recent_commits": self.recent_commits,
-            "days_since_update": (datetime.now(timezone.utc) - self.updated_at).days,
+            "days_since_update": (now - self.updated_at).days,
         }
 
 
+# How long --result-cache reuses a previous run's output (seconds)
+RESULT_CACHE_TTL = 3600
+
+# Below this many repos, importing NumPy costs more than vectorizing saves
+VECTORIZE_MIN_REPOS = 500
+
+
+def score_repos(repos: list[RepoScore], now: datetime) -> None:
+    """
+    Score all repos in place.
+
+    Large inputs are scored column-wise with NumPy when it is installed,
+    using the same formula and operation order as RepoScore.calculate_score;
+    otherwise each repo is scored individually.
+    """
+    np = None
+    if len(repos) >= VECTORIZE_MIN_REPOS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+
+    if np is None:
+        for repo in repos:
+            repo.calculate_score(now)
+        return
+
+    count = len(repos)
+
+    def column(values: Iterable[float]) -> Any:
+        return np.fromiter(values, dtype=np.float64, count=count)
+
+    commits = column(r.recent_commits for r in repos)
+    stars = column(r.stars for r in repos)
+    forks = column(r.forks for r in repos)
+    activity = column(r.recent_issues + r.recent_prs for r in repos)
+    pushes = column(r.recent_pushes for r in repos)
+    days = column((now - r.updated_at).days for r in repos)
+
+    scores = (
+        np.minimum(commits * _COMMIT_INV, 1.0) * _COMMIT_WEIGHT
+        + np.minimum(stars * _STAR_INV, 1.0) * _STAR_WEIGHT
+        + np.minimum(forks * _FORK_INV, 1.0) * _FORK_WEIGHT
+        + np.minimum(activity * _ACTIVITY_INV, 1.0) * _ACTIVITY_WEIGHT
+        + np.minimum(pushes * _PUSH_INV, 1.0) * _PUSH_WEIGHT
+        + np.maximum(0, 1 - days * _RECENCY_INV) * _RECENCY_WEIGHT
+    )
+
+    for repo, score in zip(repos, scores.tolist()):
+        repo.score = score
+
+
+def is_scoreable(repo_data: dict[str, Any], exclude: list[str] | None) -> bool:
+    """Whether a raw API repo takes part in the ranking."""
+    # Skip forks for top repos ranking
+    if repo_data.get("fork"):
+        return False
+
+    # Skip archived repos
+    if repo_data.get("archived"):
+        return False
+
+    # Skip explicitly excluded repos
+    if exclude and repo_data["name"] in exclude:
+        return False
+
+    return True
+
+
+def _count_push(counts: Counter[str], event: dict[str, Any]) -> None:
+    """Count a push and the commits it carries."""
+    payload = event.get("payload")
+    commits = payload.get("commits") if payload else None
+    counts["recent_commits"] += len(commits) if commits else 0
+    counts["recent_pushes"] += 1
+
+
+def _count_issue(counts: Counter[str], event: dict[str, Any]) -> None:
+    """Count an issue event."""
+    counts["recent_issues"] += 1
+
+
+def _count_pr(counts: Counter[str], event: dict[str, Any]) -> None:
+    """Count a pull request event."""
+    counts["recent_prs"] += 1
+
+
+# Event type -> handler folding one event into its repo's counts
+_EVENT_HANDLERS = {
+    "PushEvent": _count_push,
+    "IssuesEvent": _count_issue,
+    "PullRequestEvent": _count_pr,
+}
+
+
+def tally_events(events: Iterable[dict[str, Any]]) -> dict[str, Counter[str]]:
+    """
+    Fold events into per-repo activity counts, keyed by full repo name.
+
+    Counts are named after the RepoScore fields they populate.
+    """
+    activity: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+    for event in events:
+        # Plain lookups; no throwaway {} defaults for absent keys
+        repo_info = event.get("repo")
+        if repo_info is None:
+            continue
+        repo_name = repo_info.get("name")
+        if not repo_name:
+            continue
+
+        handler = _EVENT_HANDLERS.get(event.get("type"))
+        if handler is not None:
+            handler(activity[repo_name], event)
+
+    return activity
+
+
 class GitHubActivityAnalyzer:
     """Analyze GitHub user activity."""
 
     API_BASE = "https://api.github.com"
 
-    def __init__(self, token: str | None = None) -> None:
+    def __init__(self, token: str | None = None, cache_file: Path | None = None) -> None:
+        self.cache_file = cache_file
+        self._etag_cache: dict[str, dict[str, Any]] = {}
         self.session = requests.Session()
+        # Keep enough pooled keep-alive connections for the concurrent page
+        # fetches, and retry rate limiting and transient gateway errors.
+        # raise_on_status=False hands the last response back so that
+        # raise_for_status still reports it as an HTTPError.
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
+        )
         self.session.headers.update({
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
@@ -111,64 +298,132 @@ class GitHubActivityAnalyzer:
         if token:
             self.session.headers["Authorization"] = f"Bearer {token}"
 
+    def load_cache(self) -> None:
+        """Load cached ETags and response bodies from the sidecar file."""
+        if not self.cache_file:
+            return
+        try:
+            cache = json_loads(self.cache_file.read_bytes())
+        except (OSError, ValueError):
+            cache = None
+
+        # Start empty rather than fail mid-fetch on a file of the wrong shape
+        if isinstance(cache, dict) and all(
+            isinstance(entry, dict)
+            and isinstance(entry.get("etag"), str)
+            and "body" in entry
+            and isinstance(entry.get("links", {}), dict)
+            for entry in cache.values()
+        ):
+            self._etag_cache = cache
+        else:
+            self._etag_cache = {}
+
+    def save_cache(self) -> None:
+        """Persist cached ETags and response bodies to the sidecar file."""
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.write_bytes(json_bytes(self._etag_cache))
+        except OSError as e:
+            print(f"Warning: could not write cache {self.cache_file}: {e}", file=sys.stderr)
+
+    def _get_page(
+        self, url: str, params: dict[str, Any]
+    ) -> tuple[Any, dict[str, dict[str, str]]]:
+        """
+        GET a JSON page and its parsed Link header, revalidating when cached.
+
+        GitHub answers an unchanged page with 304 Not Modified (no body, and
+        no rate-limit cost), in which case the cached body and links are reused.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}"
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+
+        response = self.session.get(url, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return cached["body"], cached.get("links", {})
+        response.raise_for_status()
+        # Decode the raw body; skips building response.text first
+        data = json_loads(response.content)
+        links = response.links
+
+        # Bodies are only kept when there is a sidecar file to persist them to
+        etag = response.headers.get("ETag")
+        if etag and self.cache_file:
+            self._etag_cache[key] = {"etag": etag, "body": data, "links": links}
+        return data, links
+
+    def _get_json(self, url: str, params: dict[str, Any]) -> Any:
+        """GET a JSON page; see _get_page."""
+        return self._get_page(url, params)[0]
+
     def get_user_repos(self, username: str) -> list[dict[str, Any]]:
-        """Fetch all public repositories for a user."""
-        repos: list[dict[str, Any]] = []
-        page = 1
-        per_page = 100
-
-        while True:
-            response = self.session.get(
-                f"{self.API_BASE}/users/{username}/repos",
-                params={
-                    "type": "owner",  # Only repos owned by user
-                    "sort": "updated",
-                    "direction": "desc",
-                    "per_page": per_page,
-                    "page": page,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        """
+        Fetch all public repositories for a user.
 
-            if not data:
-                break
+        Page 1's Link header (rel="last") gives the page count, so every
+        remaining page is fetched concurrently rather than one round-trip
+        at a time, with no fixed cap on how many there are.
+        """
+        url = f"{self.API_BASE}/users/{username}/repos"
+        params = {
+            "type": "owner",  # Only repos owned by user
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": 100,
+        }
 
-            repos.extend(data)
-            page += 1
+        first_page, links = self._get_page(url, {**params, "page": 1})
+        if not first_page:
+            return []
 
-            # Safety limit
-            if page > 10:
-                break
+        last_url = links.get("last", {}).get("url")
+        last_page = int(parse_qs(urlsplit(last_url).query)["page"][0]) if last_url else 1
 
-        return repos
+        if last_page == 1:
+            return first_page
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # map() keeps page order, so ties rank as they did serially
+            pages = executor.map(
+                lambda page: self._get_json(url, {**params, "page": page}),
+                range(2, last_page + 1),
+            )
+            # A new list, so page bodies held by the ETag cache stay untouched
+            return list(chain(first_page, *pages))
+
+    def iter_user_events(
+        self,
+        username: str,
+        days: int = 90,
+        stop: threading.Event | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield recent public events for a user, fetching pages on demand.
 
-    def get_user_events(
-        self, username: str, days: int = 90
-    ) -> list[dict[str, Any]]:
-        """Fetch recent public events for a user."""
-        events: list[dict[str, Any]] = []
+        Setting stop ends the stream before the next page is requested.
+        """
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         page = 1
 
         # GitHub events API: max 300 events (3 pages of 100)
-        while page <= 3:
+        while page <= 3 and not (stop and stop.is_set()):
             try:
-                response = self.session.get(
+                data = self._get_json(
                     f"{self.API_BASE}/users/{username}/events/public",
-                    params={"per_page": 100, "page": page},
+                    {"per_page": 100, "page": page},
                 )
-                response.raise_for_status()
-                data = response.json()
 
                 if not data:
                     break
 
                 for event in data:
-                    event_time = parse_date(event["created_at"])
+                    event_time = parse_gh_timestamp(event["created_at"])
                     if event_time < cutoff:
-                        return events
-                    events.append(event)
+                        return
+                    yield event
 
                 page += 1
             except requests.HTTPError as e:
@@ -177,8 +432,6 @@ class GitHubActivityAnalyzer:
                     break
                 raise
 
-        return events
-
     def analyze_repos(
         self,
         username: str,
@@ -195,30 +448,33 @@ class GitHubActivityAnalyzer:
         now = datetime.now(timezone.utc)
         cutoff_new = now - timedelta(days=new_days)
 
-        # Fetch data
-        raw_repos = self.get_user_repos(username)
-        events = self.get_user_events(username)
+        # Fetch data; repos and events are independent, so overlap the round-trips.
+        # Events are folded into counts as pages arrive rather than kept around,
+        # and further pages are skipped once no repo is left to credit them to.
+        self.load_cache()
+        stop_events = threading.Event()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            repos_future = executor.submit(self.get_user_repos, username)
+            activity_future = executor.submit(
+                tally_events, self.iter_user_events(username, stop=stop_events)
+            )
+            raw_repos = repos_future.result()
+            if not any(is_scoreable(r, exclude) for r in raw_repos):
+                stop_events.set()
+            activity = activity_future.result()
+        self.save_cache()
 
         # Build repo objects
         repos: dict[str, RepoScore] = {}
         new_repos: list[RepoScore] = []
 
         for repo_data in raw_repos:
-            # Skip forks for top repos ranking
-            if repo_data.get("fork"):
+            if not is_scoreable(repo_data, exclude):
                 continue
 
-            # Skip archived repos
-            if repo_data.get("archived"):
-                continue
-
-            # Skip explicitly excluded repos
-            if exclude and repo_data["name"] in exclude:
-                continue
-
-            created = parse_date(repo_data["created_at"])
-            updated = parse_date(repo_data["updated_at"])
-            pushed = parse_date(repo_data["pushed_at"]) if repo_data.get("pushed_at") else updated
+            created = parse_gh_timestamp(repo_data["created_at"])
+            updated = parse_gh_timestamp(repo_data["updated_at"])
+            pushed = parse_gh_timestamp(repo_data["pushed_at"]) if repo_data.get("pushed_at") else updated
 
             repo = RepoScore(
                 name=repo_data["name"],
@@ -242,36 +498,51 @@ class GitHubActivityAnalyzer:
             if created > cutoff_new:
                 new_repos.append(repo)
 
-        # Process events to count activity
-        for event in events:
-            repo_name = event.get("repo", {}).get("name")
-            if not repo_name or repo_name not in repos:
+        if not repos:
+            return [], []
+
+        # Apply event activity to the repos being ranked
+        for repo_name, counts in activity.items():
+            repo = repos.get(repo_name)
+            if repo is None:
                 continue
+            for name, value in counts.items():
+                setattr(repo, name, value)
 
-            repo = repos[repo_name]
-            event_type = event.get("type")
+        # Calculate scores and select the top N (nlargest keeps sorted()'s tie order)
+        score_repos(list(repos.values()), now)
 
-            if event_type == "PushEvent":
-                commits = event.get("payload", {}).get("commits", [])
-                repo.recent_commits += len(commits)
-                repo.recent_pushes += 1
-            elif event_type == "IssuesEvent":
-                repo.recent_issues += 1
-            elif event_type == "PullRequestEvent":
-                repo.recent_prs += 1
+        top_repos = heapq.nlargest(top_count, repos.values(), key=lambda r: r.score)
 
-        # Calculate scores and sort
-        for repo in repos.values():
-            repo.calculate_score(now)
+        # Newest repos by creation date
+        new_repos = heapq.nlargest(5, new_repos, key=lambda r: r.created_at)
 
-        top_repos = sorted(repos.values(), key=lambda r: r.score, reverse=True)[
-            :top_count
-        ]
+        return top_repos, new_repos
 
-        # Sort new repos by creation date
-        new_repos = sorted(new_repos, key=lambda r: r.created_at, reverse=True)[:5]
 
-        return top_repos, new_repos
+def load_cached_result(path: Path, key: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the output cached for key if it is younger than RESULT_CACHE_TTL."""
+    try:
+        cached = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    # Anything unexpected is treated as a miss rather than failing the run
+    if not isinstance(cached, dict) or not isinstance(cached.get("output"), dict):
+        return None
+    ts = cached.get("ts")
+    if not isinstance(ts, (int, float)) or cached.get("key") != key:
+        return None
+    if time.time() - ts >= RESULT_CACHE_TTL:
+        return None
+    return cached["output"]
+
+
+def save_cached_result(path: Path, key: dict[str, Any], output: dict[str, Any]) -> None:
+    """Store this run's output for load_cached_result."""
+    try:
+        path.write_bytes(json_bytes({"ts": time.time(), "key": key, "output": output}))
+    except OSError as e:
+        print(f"Warning: could not write result cache {path}: {e}", file=sys.stderr)
 
 
 def main() -> int:
@@ -292,6 +563,16 @@ def main() -> int:
         default=[],
         help="Repository name to exclude from results (repeatable)",
     )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help="JSON file for ETag-cached API responses (reused via 304 Not Modified)",
+    )
+    parser.add_argument(
+        "--result-cache",
+        type=Path,
+        help="JSON file holding the last result; reruns within an hour reuse it",
+    )
     parser.add_argument(
         "--output-format",
         choices=["json", "github-output"],
@@ -302,40 +583,67 @@ def main() -> int:
 
     token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
 
+    # Cached results are only reused for the same analysis parameters
+    cache_key = {
+        "user": args.user,
+        "top_count": args.top_count,
+        "new_days": args.new_days,
+        "exclude": sorted(args.exclude),
+    }
+
     try:
-        analyzer = GitHubActivityAnalyzer(token)
-        top_repos, new_repos = analyzer.analyze_repos(
-            args.user, args.top_count, args.new_days, exclude=args.exclude
-        )
+        output = None
+        if args.result_cache:
+            output = load_cached_result(args.result_cache, cache_key)
+
+        if output is None:
+            analyzer = GitHubActivityAnalyzer(token, cache_file=args.cache_file)
+            top_repos, new_repos = analyzer.analyze_repos(
+                args.user, args.top_count, args.new_days, exclude=args.exclude
+            )
 
-        top_repos_data = [r.to_dict() for r in top_repos]
-        new_repos_data = [r.to_dict() for r in new_repos]
+            now = datetime.now(timezone.utc)
+            top_repos_data = [r.to_dict(now) for r in top_repos]
+            new_repos_data = [r.to_dict(now) for r in new_repos]
 
-        summary = {
-            "analyzed_at": datetime.now(timezone.utc).isoformat(),
-            "user": args.user,
-            "top_repos_count": len(top_repos_data),
-            "new_repos_count": len(new_repos_data),
-        }
+            output = {
+                "top_repos": top_repos_data,
+                "new_repos": new_repos_data,
+                "summary": {
+                    "analyzed_at": now.isoformat(),
+                    "user": args.user,
+                    "top_repos_count": len(top_repos_data),
+                    "new_repos_count": len(new_repos_data),
+                },
+            }
+            if args.result_cache:
+                save_cached_result(args.result_cache, cache_key, output)
+
+        top_repos_data = output["top_repos"]
+        new_repos_data = output["new_repos"]
+        summary = output["summary"]
 
         if args.output_format == "github-output":
             # Write to GitHub Actions output
             output_file = os.environ.get("GITHUB_OUTPUT")
             if output_file:
-                with open(output_file, "a") as f:
-                    # Use heredoc for multiline JSON
-                    f.write(f"top_repos<<EOF\n{json.dumps(top_repos_data)}\nEOF\n")
-                    f.write(f"new_repos<<EOF\n{json.dumps(new_repos_data)}\nEOF\n")
-                    f.write(f"summary<<EOF\n{json.dumps(summary)}\nEOF\n")
+                # Use heredoc for multiline JSON, appended in a single write
+                buf = b"".join([
+                    b"top_repos<<EOF\n", json_bytes(top_repos_data), b"\nEOF\n",
+                    b"new_repos<<EOF\n", json_bytes(new_repos_data), b"\nEOF\n",
+                    b"summary<<EOF\n", json_bytes(summary), b"\nEOF\n",
+                ])
+                fd = os.open(output_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    # os.write may write less than asked; finish the rest
+                    while buf:
+                        buf = buf[os.write(fd, buf):]
+                finally:
+                    os.close(fd)
             else:
                 print("Warning: GITHUB_OUTPUT not set", file=sys.stderr)
                 print(json.dumps({"top_repos": top_repos_data, "new_repos": new_repos_data}, indent=2))
         else:
-            output = {
-                "top_repos": top_repos_data,
-                "new_repos": new_repos_data,
-                "summary": summary,
-            }
             print(json.dumps(output, indent=2))
 
         return 0
@@ -10,49 +10,91 @@ Replaces content between marker comments:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Start/end comment pairs delimiting the generated sections
+ACTIVE_REPOS_MARKERS = ("<!-- ACTIVE_REPOS_START -->", "<!-- ACTIVE_REPOS_END -->")
+NEW_REPOS_MARKERS = ("<!-- NEW_REPOS_START -->", "<!-- NEW_REPOS_END -->")
+LAST_UPDATED_MARKERS = ("<!-- LAST_UPDATED_START -->", "<!-- LAST_UPDATED_END -->")
+
+
+def replace_between_markers(content: str, start: str, end: str, body: str) -> str:
+    """
+    Replace the text between every start/end marker pair with body.
+
+    Markers are fixed literals, so they are located with str.find and the
+    result is spliced in a single pass. Unlike re.sub, backslashes in body
+    are inserted verbatim.
+    """
+    parts = []
+    pos = 0
+    while True:
+        start_idx = content.find(start, pos)
+        if start_idx < 0:
+            break
+        end_idx = content.find(end, start_idx + len(start))
+        if end_idx < 0:
+            break
+        parts.append(content[pos : start_idx + len(start)])
+        parts.append(f"\n{body}\n{end}")
+        pos = end_idx + len(end)
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+# Escapes table-breaking pipes in one C-level pass
+_PIPE_TBL = str.maketrans({"|": "\\|"})
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Activity indicators by minimum score, highest threshold first
+_ACTIVITY = (
+    (0.7, "🔥 Very Active"),
+    (0.4, "✨ Active"),
+    (0.2, "📈 Growing"),
+)
+
+
+def _activity(score: float) -> str:
+    """Activity indicator based on score."""
+    for threshold, label in _ACTIVITY:
+        if score >= threshold:
+            return label
+    return "💤 Stable"
+
 
 def generate_active_repos_section(repos: list[dict[str, Any]]) -> str:
     """Generate markdown table for top active repositories."""
     if not repos:
         return "_No active repositories found._"
 
-    lines = [
-        "| Repository | Description | Tech | Activity |",
-        "|------------|-------------|------|----------|",
-    ]
-
-    for repo in repos:
-        name = repo["name"]
-        url = repo["url"]
-        desc = (
-            repo["description"][:60] + "..."
-            if len(repo["description"]) > 60
-            else repo["description"]
-        )
-        desc = desc.replace("|", "\\|")  # Escape pipes
-        lang = repo["language"]
-        score = repo["score"]
-
-        # Activity indicator based on score
-        if score >= 0.7:
-            activity = "🔥 Very Active"
-        elif score >= 0.4:
-            activity = "✨ Active"
-        elif score >= 0.2:
-            activity = "📈 Growing"
-        else:
-            activity = "💤 Stable"
-
-        lines.append(f"| [{name}]({url}) | {desc} | {lang} | {activity} |")
-
-    return "\n".join(lines)
+    header = (
+        "| Repository | Description | Tech | Activity |\n"
+        "|------------|-------------|------|----------|\n"
+    )
+    return header + "\n".join(
+        f"| [{repo['name']}]({repo['url']}) "
+        f"| {_truncate(repo['description'], 60).translate(_PIPE_TBL)} "
+        f"| {repo['language']} | {_activity(repo['score'])} |"
+        for repo in repos
+    )
 
 
 def generate_new_repos_section(repos: list[dict[str, Any]]) -> str:
@@ -60,17 +102,33 @@ def generate_new_repos_section(repos: list[dict[str, Any]]) -> str:
     if not repos:
         return "_No new repositories in the last 90 days._"
 
-    lines = []
-    for repo in repos:
-        name = repo["name"]
-        url = repo["url"]
-        desc = repo["description"] or "No description"
-        desc = desc[:80] + "..." if len(desc) > 80 else desc
-        lang = repo["language"]
+    return "\n".join(
+        f"- **[{repo['name']}]({repo['url']})** ({repo['language']}) - "
+        f"{_truncate(repo['description'] or 'No description', 80)}"
+        for repo in repos
+    )
+
+
+def _readme_state(readme_path: Path, digest: str) -> dict[str, Any]:
+    """Snapshot of the README file and the section digest it was built from."""
+    st = readme_path.stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "digest": digest}
+
+
+def _load_state(state_path: Path) -> dict[str, Any] | None:
+    """Read the recorded README state, or None if there is none."""
+    try:
+        return json_loads(state_path.read_bytes())
+    except (OSError, ValueError):
+        return None
 
-        lines.append(f"- **[{name}]({url})** ({lang}) - {desc}")
 
-    return "\n".join(lines)
+def _save_state(state_path: Path, state: dict[str, Any]) -> None:
+    """Record the README state for the next run."""
+    try:
+        state_path.write_text(json.dumps(state))
+    except OSError as e:
+        print(f"Warning: could not write state {state_path}: {e}", file=sys.stderr)
 
 
 def update_readme(
@@ -78,39 +136,51 @@ def update_readme(
     top_repos: list[dict[str, Any]],
     new_repos: list[dict[str, Any]],
     dry_run: bool = False,
+    state_path: Path | None = None,
 ) -> bool:
     """
     Update README with new content between markers.
 
+    With state_path, the README's mtime/size and a digest of the generated
+    sections are recorded there; a later run whose sections and README file
+    both match skips reading and rewriting the README.
+
     Returns True if changes were made.
     """
-    content = readme_path.read_text()
-    original = content
-
     # Generate sections
     active_section = generate_active_repos_section(top_repos)
     new_section = generate_new_repos_section(new_repos)
 
     # Update timestamp
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    timestamp = datetime.now(timezone.utc).date().isoformat()
+
+    digest = None
+    if state_path is not None:
+        digest = hashlib.blake2b(
+            "\0".join((active_section, new_section, timestamp)).encode(), digest_size=16
+        ).hexdigest()
+        if _load_state(state_path) == _readme_state(readme_path, digest):
+            print("No changes needed")
+            return False
+
+    content = readme_path.read_text()
+    original = content
 
-    # Pattern for active repos section
-    active_pattern = r"(<!-- ACTIVE_REPOS_START -->).*?(<!-- ACTIVE_REPOS_END -->)"
-    active_replacement = rf"\1\n{active_section}\n\2"
-    content = re.sub(active_pattern, active_replacement, content, flags=re.DOTALL)
+    # Active repos section
+    content = replace_between_markers(content, *ACTIVE_REPOS_MARKERS, active_section)
 
-    # Pattern for new repos section
-    new_pattern = r"(<!-- NEW_REPOS_START -->).*?(<!-- NEW_REPOS_END -->)"
-    new_replacement = rf"\1\n{new_section}\n\2"
-    content = re.sub(new_pattern, new_replacement, content, flags=re.DOTALL)
+    # New repos section
+    content = replace_between_markers(content, *NEW_REPOS_MARKERS, new_section)
 
     # Update timestamp marker if present
-    timestamp_pattern = r"(<!-- LAST_UPDATED_START -->).*?(<!-- LAST_UPDATED_END -->)"
-    timestamp_replacement = rf"\1\n __Last updated: {timestamp}__\n\2"
-    content = re.sub(timestamp_pattern, timestamp_replacement, content, flags=re.DOTALL)
+    content = replace_between_markers(
+        content, *LAST_UPDATED_MARKERS, f" __Last updated: {timestamp}__"
+    )
 
     if content == original:
         print("No changes needed")
+        if digest is not None:
+            _save_state(state_path, _readme_state(readme_path, digest))
         return False
 
     if dry_run:
@@ -120,6 +190,8 @@ def update_readme(
 
     readme_path.write_text(content)
     print(f"Updated {readme_path}")
+    if digest is not None:
+        _save_state(state_path, _readme_state(readme_path, digest))
     return True
 
 
@@ -150,16 +222,21 @@ def main() -> int:
         action="store_true",
         help="Preview changes without writing",
     )
+    parser.add_argument(
+        "--state-file",
+        type=Path,
+        help="JSON file recording the last update; skips runs that would not change the README",
+    )
     args = parser.parse_args()
 
     try:
         if args.input_file:
-            data = json.loads(args.input_file.read_text())
+            data = json_loads(args.input_file.read_bytes())
             top_repos = data.get("top_repos", [])
             new_repos = data.get("new_repos", [])
         else:
-            top_repos = json.loads(args.top_repos) if args.top_repos else []
-            new_repos = json.loads(args.new_repos) if args.new_repos else []
+            top_repos = json_loads(args.top_repos) if args.top_repos else []
+            new_repos = json_loads(args.new_repos) if args.new_repos else []
     except json.JSONDecodeError as e:
         print(f"Invalid JSON: {e}", file=sys.stderr)
         return 1
@@ -168,7 +245,9 @@ def main() -> int:
         print(f"README not found: {args.readme_path}", file=sys.stderr)
         return 1
 
-    changed = update_readme(args.readme_path, top_repos, new_repos, args.dry_run)
+    changed = update_readme(
+        args.readme_path, top_repos, new_repos, args.dry_run, state_path=args.state_file
+    )
     return 0 if changed or args.dry_run else 0
 
 